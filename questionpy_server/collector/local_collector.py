@@ -151,9 +151,11 @@ class LocalCollector(BaseCollector):
                 A generator of directory entries.
             """
             if directory is not None:
-                for entry in scandir(directory):
-                    if entry.is_file() and entry.name.endswith(".qpy"):
-                        yield entry
+                with scandir(directory) as entries:
+                    for entry in entries:
+                        # Check the name first, as is_file() needs a stat call if the listing doesn't include the type.
+                        if entry.name.endswith(".qpy") and entry.is_file():
+                            yield entry
 
         async def add_package(pkg_hash: str, pkg_path: Path) -> None:
             """Adds a package to the map and registers it in the indexer.
@@ -2,12 +2,10 @@
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
-from hashlib import sha256
+from hashlib import file_digest, sha256
 from pathlib import Path
 from typing import NamedTuple
 
-from questionpy_common.constants import MiB
-
 
 def calculate_hash(source: bytes | Path) -> str:
     """Calculates the sha256 of either bytes or a file.
@@ -18,16 +16,12 @@ def calculate_hash(source: bytes | Path) -> str:
     Returns:
         str: the sha256
     """
-    sha = sha256()
-
     if isinstance(source, bytes):
-        sha.update(source)
-    else:
-        with source.open("rb") as file:
-            while chunk := file.read(5 * MiB):
-                sha.update(chunk)
+        return sha256(source).hexdigest()
 
-    return sha.hexdigest()
+    # The file is read unbuffered, as file_digest reads it in large chunks into its own buffer anyway.
+    with source.open("rb", buffering=0) as file:
+        return file_digest(file, sha256).hexdigest()
 
 
 class HashContainer(NamedTuple):
@@ -2,7 +2,9 @@
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
-from asyncio import create_task
+import asyncio
+import os
+import sys
 from typing import Any, ClassVar
 
 from aiohttp import web
@@ -45,13 +47,31 @@ class QPyServer:
             self.worker_pool,
         )
 
+        self.web_app.on_startup.append(self._use_pidfd_child_watcher)
         self.web_app.on_startup.append(self._start_package_collection)
         self.web_app.on_shutdown.append(self._stop_package_collection)
 
+    async def _use_pidfd_child_watcher(self, _app: web.Application) -> None:
+        # Before Python 3.12, asyncio waits for every subprocess (i.e. worker) in a dedicated thread by default. With a
+        # pidfd (Linux 5.3+), the loop can wait for them itself. Newer Python versions already do this on their own.
+        if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+            return
+
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+        except OSError:
+            # Not supported by the kernel.
+            return
+
+        # web.run_app sets the event loop before running the startup hooks, so the watcher has to be attached here.
+        watcher = asyncio.PidfdChildWatcher()
+        watcher.attach_loop(asyncio.get_running_loop())
+        asyncio.set_child_watcher(watcher)
+
     async def _start_package_collection(self, _app: web.Application) -> None:
         # The server will not wait until all package collectors are started. This is done in the background.
         # TODO: 💣 manage or await this task
-        create_task(self.package_collection.start())  # noqa: RUF006
+        asyncio.create_task(self.package_collection.start())  # noqa: RUF006
 
     async def _stop_package_collection(self, _app: web.Application) -> None:
         # Wait until all package collectors are stopped appropriately.
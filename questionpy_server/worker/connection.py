@@ -2,6 +2,7 @@
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
+from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from typing import Self
 
@@ -15,7 +16,15 @@ from questionpy_server.worker.runtime.messages import (
 from questionpy_server.worker.runtime.streams import SupportsAsyncRead, SupportsWrite
 
 
-class ServerToWorkerConnection(AsyncIterator[MessageToServer]):
+class WorkerConnection(AsyncIterator[MessageToServer], ABC):
+    """The server's end of a connection to a worker, iterating over the messages received from it."""
+
+    @abstractmethod
+    def send_message(self, message: MessageToWorker) -> None:
+        """Send a message to a worker."""
+
+
+class ServerToWorkerConnection(WorkerConnection):
     """Controls the connection (stdin/stdout pipes) from the server to a worker."""
 
     def __init__(self, stream_in: SupportsAsyncRead, stream_out: SupportsWrite):
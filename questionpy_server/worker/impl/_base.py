@@ -51,7 +51,7 @@ from questionpy_server.worker.runtime.package_location import (
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from questionpy_server.worker.connection import ServerToWorkerConnection
+    from questionpy_server.worker.connection import WorkerConnection
 
 log = logging.getLogger(__name__)
 _M = TypeVar("_M", bound=MessageToServer)
@@ -79,7 +79,7 @@ class BaseWorker(Worker, ABC):
 
         self._observe_task: asyncio.Task | None = None
 
-        self._connection: ServerToWorkerConnection | None = None
+        self._connection: WorkerConnection | None = None
         self._expected_incoming_messages: list[tuple[MessageIds, asyncio.Future]] = []
         self._receive_messages_exception: BaseException | None = None
 
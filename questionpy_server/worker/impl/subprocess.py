@@ -5,6 +5,8 @@
 import asyncio
 import logging
 import math
+import mmap
+import os
 import sys
 from asyncio import StreamReader
 from collections.abc import Sequence
@@ -35,7 +37,7 @@ class _StderrBuffer:
     def __init__(self, stderr: StreamReader):
         self._stderr = stderr
         self._buffer = bytearray()
-        self._max_size = 5 * KiB
+        self._max_size = 8 * KiB
         self._skipped_bytes = 0
 
     async def read_stderr(self) -> None:
@@ -43,7 +45,8 @@ class _StderrBuffer:
 
         Only read up to a certain amount due to security reasons and stderr should not be used besides debugging.
         """
-        while True:
+        # The buffer is only ever logged at DEBUG level, so stop filling it if that was disabled in the meantime.
+        while log.isEnabledFor(logging.DEBUG):
             space_left = self._max_size - len(self._buffer)
             if space_left == 0:
                 break
@@ -65,10 +68,11 @@ class _StderrBuffer:
             msg = "Worker wrote following data to stdout/stderr."
             if self._skipped_bytes:
                 msg += f" (Additional {ByteSize(self._skipped_bytes).human_readable()} were skipped.)"
-            indented_data = "\n".join("\t" + line for line in self._buffer.decode(errors="replace").split("\n"))
-            log.debug("%s\n%s", msg, indented_data)
+            indented_data = self._buffer.decode(errors="replace").replace("\n", "\n\t")
+            log.debug("%s\n\t%s", msg, indented_data)
 
-        self._buffer = bytearray()
+        # Keep the underlying allocation for the next exchange.
+        self._buffer.clear()
         self._skipped_bytes = 0
 
 
@@ -84,6 +88,8 @@ class SubprocessWorker(BaseWorker, LimitTimeUsageMixin):
         super().__init__(package=package, limits=limits)
 
         self._proc: Process | None = None
+        self._psutil_proc: psutil.Process | None = None
+        self._statm_fd: int | None = None
         self._stderr_buffer: _StderrBuffer | None = None
 
     async def start(self) -> None:
@@ -91,26 +97,38 @@ class SubprocessWorker(BaseWorker, LimitTimeUsageMixin):
         # Turn off the worker's __debug__ flag unless ours is set as well.
         python_flags = [] if __debug__ else ["-O"]
 
+        # The worker's stderr is only ever logged at DEBUG level. If that is disabled, we let the OS discard the output
+        # instead of continuously reading and dropping it ourselves.
+        capture_stderr = log.isEnabledFor(logging.DEBUG)
+
         self._proc = await asyncio.create_subprocess_exec(
             sys.executable,
             *python_flags,
             *self._runtime_main,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL,
         )
 
-        if self._proc.stdout is None or self._proc.stderr is None or self._proc.stdin is None:
+        if self._proc.stdout is None or self._proc.stdin is None or (capture_stderr and self._proc.stderr is None):
             raise WorkerStartError
 
-        self._stderr_buffer = _StderrBuffer(self._proc.stderr)
+        # Creating a psutil.Process reads from procfs, so we only do it once instead of every time we poll the usage.
+        self._psutil_proc = psutil.Process(self._proc.pid)
+        if sys.platform == "linux":
+            # Keep statm open, so polling the memory usage costs a single pread instead of open, read and close.
+            self._statm_fd = os.open(f"/proc/{self._proc.pid}/statm", os.O_RDONLY)
+
+        if self._proc.stderr:
+            self._stderr_buffer = _StderrBuffer(self._proc.stderr)
         self._connection = ServerToWorkerConnection(self._proc.stdout, self._proc.stdin)
 
         try:
             await self._initialize()
         finally:
             # Whether initialization was successful or not, flush the logs.
-            self._stderr_buffer.flush()
+            if self._stderr_buffer:
+                self._stderr_buffer.flush()
 
     async def send_and_wait_for_response(
         self, message: MessageToWorker, expected_response_message: type[_T], timeout: float | None = None
@@ -127,28 +145,48 @@ class SubprocessWorker(BaseWorker, LimitTimeUsageMixin):
                 self._stderr_buffer.flush()
 
     async def get_resource_usage(self) -> WorkerResources:
-        if not self._proc or self._proc.returncode is not None:
+        if not self._proc or not self._psutil_proc or self._proc.returncode is not None:
             raise WorkerNotRunningError
 
-        psutil_proc = psutil.Process(self._proc.pid)
         return WorkerResources(
-            memory=psutil_proc.memory_info().rss,
+            memory=self._get_rss(),
             cpu_time_since_last_call=0,
             total_cpu_time=0,
         )
 
+    def _get_rss(self) -> int:
+        if self._statm_fd is None:
+            if not self._psutil_proc:
+                raise WorkerNotRunningError
+            return self._psutil_proc.memory_info().rss
+
+        try:
+            statm = os.pread(self._statm_fd, 128, 0)
+        except ProcessLookupError as e:
+            raise WorkerNotRunningError from e
+
+        # The second field is the resident set size in pages.
+        return int(statm.split(maxsplit=2)[1]) * mmap.PAGESIZE
+
     def _get_observation_tasks(self) -> Sequence[asyncio.Task]:
-        if not self._proc or not self._stderr_buffer:
+        if not self._proc:
             raise WorkerNotRunningError
 
-        return (
+        tasks = [
             *super()._get_observation_tasks(),
             asyncio.create_task(self._proc.wait(), name="wait for worker process"),
-            asyncio.create_task(self._stderr_buffer.read_stderr(), name="receive stderr from worker"),
             asyncio.create_task(self._limit_cpu_time_usage(), name="limit cpu time usage"),
-        )
+        ]
+        if self._stderr_buffer:
+            tasks.append(asyncio.create_task(self._stderr_buffer.read_stderr(), name="receive stderr from worker"))
+
+        return tasks
 
     async def kill(self) -> None:
+        if self._statm_fd is not None:
+            os.close(self._statm_fd)
+            self._statm_fd = None
+
         if self._proc and self._proc.returncode is None:
             self._proc.kill()
 
@@ -156,9 +194,8 @@ class SubprocessWorker(BaseWorker, LimitTimeUsageMixin):
             await self._proc.wait()
 
     def _get_cpu_time(self) -> float:
-        if not self._proc or self._proc.returncode is not None:
+        if not self._proc or not self._psutil_proc or self._proc.returncode is not None:
             raise WorkerNotRunningError
 
-        psutil_proc = psutil.Process(self._proc.pid)
-        cpu_times = psutil_proc.cpu_times()
+        cpu_times = self._psutil_proc.cpu_times()
         return cpu_times.user + cpu_times.system
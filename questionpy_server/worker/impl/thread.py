@@ -5,32 +5,98 @@
 import asyncio
 import itertools
 import logging
+import queue
 import sys
 import threading
 from asyncio import Task
 from collections.abc import Sequence
 
 from questionpy_common.environment import WorkerResourceLimits
-from questionpy_server.worker.connection import ServerToWorkerConnection
+from questionpy_server.worker.connection import WorkerConnection
 from questionpy_server.worker.exception import WorkerNotRunningError
 from questionpy_server.worker.impl._base import BaseWorker
-from questionpy_server.worker.runtime.connection import WorkerToServerConnection
+from questionpy_server.worker.runtime.connection import ServerConnection
 from questionpy_server.worker.runtime.manager import WorkerManager
+from questionpy_server.worker.runtime.messages import MessageToServer, MessageToWorker
 from questionpy_server.worker.runtime.package_location import PackageLocation
-from questionpy_server.worker.runtime.streams import AsyncReadAdapter, DuplexPipe
 
 log = logging.getLogger(__name__)
 
 
+class _InProcessConnection:
+    """Passes messages between the server and a worker thread without serializing them.
+
+    Both sides live in the same process, so there is no need to encode the messages and send them through a pipe. A
+    ``None`` in either queue signals that the connection was closed.
+    """
+
+    class ServerSide(WorkerConnection):
+        """Used by the server in the event loop's thread."""
+
+        def __init__(
+            self, to_worker: queue.SimpleQueue[MessageToWorker | None], to_server: asyncio.Queue[MessageToServer | None]
+        ) -> None:
+            self._to_worker = to_worker
+            self._to_server = to_server
+
+        def send_message(self, message: MessageToWorker) -> None:
+            self._to_worker.put(message)
+
+        async def __anext__(self) -> MessageToServer:
+            message = await self._to_server.get()
+            if message is None:
+                raise StopAsyncIteration
+            return message
+
+    class WorkerSide(ServerConnection):
+        """Used by the worker in its own thread."""
+
+        def __init__(
+            self,
+            to_worker: queue.SimpleQueue[MessageToWorker | None],
+            to_server: asyncio.Queue[MessageToServer | None],
+            loop: asyncio.AbstractEventLoop,
+        ) -> None:
+            self._to_worker = to_worker
+            self._to_server = to_server
+            self._loop = loop
+
+        def send_message(self, message: MessageToServer) -> None:
+            # asyncio.Queue is not threadsafe, so we schedule putting the message in the event loop's thread instead.
+            self._loop.call_soon_threadsafe(self._to_server.put_nowait, message)
+
+        def receive_message(self) -> MessageToWorker:
+            message = self._to_worker.get()
+            if message is None:
+                raise BrokenPipeError
+            return message
+
+    def __init__(self) -> None:
+        self._to_worker: queue.SimpleQueue[MessageToWorker | None] = queue.SimpleQueue()
+        self._to_server: asyncio.Queue[MessageToServer | None] = asyncio.Queue()
+
+        self.server = self.ServerSide(self._to_worker, self._to_server)
+        self.worker = self.WorkerSide(self._to_worker, self._to_server, asyncio.get_running_loop())
+
+    def close(self) -> None:
+        """Closes both sides of the connection. Must be called from the event loop's thread."""
+        self._to_worker.put(None)
+        self._to_server.put_nowait(None)
+
+
 class _WorkerThread(threading.Thread):
     _counter = itertools.count()
     """Counter serving only to give worker threads unique names."""
 
-    def __init__(self, pipe: DuplexPipe) -> None:
+    def __init__(self, connection: ServerConnection) -> None:
         super().__init__(name=f"qpy-worker-{next(self._counter)}", daemon=True)
-        self._pipe = pipe
+        self._connection = connection
         self._end_event = asyncio.Event()
+
+    def start(self) -> None:
+        # The loop must be captured in the event loop's thread, since run() is executed in the worker thread.
         self._loop = asyncio.get_running_loop()
+        super().start()
 
     def run(self) -> None:
         self._end_event.clear()
@@ -40,8 +106,7 @@ class _WorkerThread(threading.Thread):
         original_path = sys.path.copy()
         original_module_names = set(sys.modules.keys())
 
-        connection = WorkerToServerConnection(self._pipe.right, self._pipe.right)
-        manager = WorkerManager(connection)
+        manager = WorkerManager(self._connection)
         try:
             manager.bootstrap()
             manager.loop()
@@ -67,7 +132,7 @@ class ThreadWorker(BaseWorker):
     def __init__(self, package: PackageLocation, limits: WorkerResourceLimits | None) -> None:
         super().__init__(package=package, limits=limits)
 
-        self._pipe: DuplexPipe | None = None
+        self._in_process_connection: _InProcessConnection | None = None
 
         self._task: Task | None = None
 
@@ -76,21 +141,21 @@ class ThreadWorker(BaseWorker):
             thread.start()
             await thread.wait()
         finally:
-            if self._pipe:
-                self._pipe.close()
-                self._pipe = None
+            if self._in_process_connection:
+                self._in_process_connection.close()
+                self._in_process_connection = None
 
     async def start(self) -> None:
         if self.limits:
             log.warning("Limits '%s' were given, but thread-based workers don't support resource limits", self.limits)
             self.limits = None
 
-        self._pipe = DuplexPipe.open()
-        thread = _WorkerThread(self._pipe)
+        self._in_process_connection = _InProcessConnection()
+        thread = _WorkerThread(self._in_process_connection.worker)
 
         self._task = asyncio.create_task(self._run_and_wait(thread), name=thread.name)
 
-        self._connection = ServerToWorkerConnection(AsyncReadAdapter(self._pipe.left), self._pipe.left)
+        self._connection = self._in_process_connection.server
 
         await self._initialize()
 
@@ -2,6 +2,8 @@
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
+from abc import ABC, abstractmethod
+
 from questionpy_server.worker.runtime.messages import (
     InvalidMessageIdError,
     Message,
@@ -16,12 +18,23 @@ from questionpy_server.worker.runtime.streams import SupportsRead, SupportsWrite
 def send_message(message: Message, out: SupportsWrite) -> None:
     """Send a message to out."""
     header, json_bytes = get_message_bytes(message)
-    out.write(header)
-    if json_bytes:
-        out.write(json_bytes)
+    # Write the whole frame at once, so it only costs a single write syscall.
+    out.write(header + json_bytes if json_bytes else header)
+
+
+class ServerConnection(ABC):
+    """The worker's end of a connection to the server."""
+
+    @abstractmethod
+    def send_message(self, message: MessageToServer) -> None:
+        """Send a message to the server."""
+
+    @abstractmethod
+    def receive_message(self) -> MessageToWorker:
+        """Receive a message from the server."""
 
 
-class WorkerToServerConnection:
+class WorkerToServerConnection(ServerConnection):
     """Controls the connection (stdin/stdout pipes) from a worker to the server.
 
     `stream_in` must be buffered as we want to be able to read exactly the given number of bytes.
@@ -16,7 +16,7 @@ from questionpy_common.environment import (
     get_qpy_environment,
     set_qpy_environment,
 )
-from questionpy_server.worker.runtime.connection import WorkerToServerConnection
+from questionpy_server.worker.runtime.connection import ServerConnection
 from questionpy_server.worker.runtime.messages import (
     CreateQuestionFromOptions,
     Exit,
@@ -55,8 +55,8 @@ OnMessageCallback: TypeAlias = Callable[[M], MessageToServer]
 
 
 class WorkerManager:
-    def __init__(self, server_connection: WorkerToServerConnection):
-        self._connection: WorkerToServerConnection = server_connection
+    def __init__(self, server_connection: ServerConnection):
+        self._connection: ServerConnection = server_connection
 
         self._worker_type: str | None = None
         self._loaded_packages: dict[str, ImportablePackage] = {}
@@ -2,12 +2,36 @@
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
+import contextlib
 import sys
 from io import BufferedReader, FileIO, StringIO
 
+from questionpy_common.constants import KiB
 from questionpy_server.worker.runtime.connection import WorkerToServerConnection
 from questionpy_server.worker.runtime.manager import WorkerManager
 
+STDERR_PIPE_SIZE = 256 * KiB
+"""Requested capacity of the stderr pipe, allowing the worker to write larger bursts without blocking.
+
+Pipe buffers count against the user's ``/proc/sys/fs/pipe-user-pages-soft`` (64 MiB with 4 KiB pages by default).
+Once that is exceeded, every new pipe of the user, including the stdin/stdout pipes used to talk to workers, is reduced
+to one or two pages. The size is therefore kept moderate, as there may be many workers at once.
+"""
+
+
+def _enlarge_stderr_pipe() -> None:
+    """Try to increase the capacity of the stderr pipe to :const:`STDERR_PIPE_SIZE`.
+
+    This is only supported on Linux and only if stderr is actually a pipe, so failures are ignored.
+    """
+    try:
+        from fcntl import F_SETPIPE_SZ, fcntl  # noqa: PLC0415
+    except ImportError:
+        return
+
+    with contextlib.suppress(OSError):
+        fcntl(sys.stderr.fileno(), F_SETPIPE_SZ, STDERR_PIPE_SIZE)
+
 
 def _setup_server_communication() -> WorkerToServerConnection:
     """Setup stdin/stdout/stderr.
@@ -19,6 +43,8 @@ def _setup_server_communication() -> WorkerToServerConnection:
     file_stdout = FileIO(sys.stdout.fileno(), "w", closefd=False)
     connection = WorkerToServerConnection(BufferedReader(file_stdin), file_stdout)
 
+    _enlarge_stderr_pipe()
+
     sys.stdin = StringIO()
     sys.stdout = sys.stderr  # All writes to sys.stdout should go to stderr.
     return connection
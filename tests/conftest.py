@@ -2,10 +2,14 @@
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
+import asyncio
 import mimetypes
+import sys
 import tempfile
+from collections.abc import Iterator
 from dataclasses import dataclass
-from hashlib import sha256
+from functools import cached_property
+from hashlib import file_digest, sha256
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -13,7 +17,7 @@ import pytest
 from aiohttp.pytest_plugin import AiohttpClient
 from aiohttp.test_utils import TestClient
 
-from questionpy_common.constants import DIST_DIR, MANIFEST_FILENAME, KiB, MiB
+from questionpy_common.constants import DIST_DIR, MANIFEST_FILENAME, MiB
 from questionpy_common.manifest import PackageFile
 from questionpy_server.settings import (
     CollectorSettings,
@@ -33,23 +37,22 @@ from questionpy_server.worker.runtime.package_location import DirPackageLocation
 
 
 def get_file_hash(path: Path) -> str:
-    hash_value = sha256()
-    with path.open("rb") as file:
-        while chunk := file.read(4 * KiB):
-            hash_value.update(chunk)
-    return hash_value.hexdigest()
+    with path.open("rb", buffering=0) as file:
+        return file_digest(file, sha256).hexdigest()
 
 
 @dataclass
 class TestZipPackage(ZipPackageLocation):
     __test__ = False
 
-    def __init__(self, path: Path):
-        super().__init__(path)
+    @cached_property
+    def hash(self) -> str:
+        return get_file_hash(self.path)
 
-        self.hash = get_file_hash(self.path)
+    @cached_property
+    def manifest(self) -> ComparableManifest:
         with ZipFile(self.path) as package:
-            self.manifest = ComparableManifest.model_validate_json(package.read(f"{DIST_DIR}/{MANIFEST_FILENAME}"))
+            return ComparableManifest.model_validate_json(package.read(f"{DIST_DIR}/{MANIFEST_FILENAME}"))
 
 
 @dataclass
@@ -98,7 +101,8 @@ class TestPackageFactory:
     def to_dir_package(self, package: ZipPackageLocation) -> TestDirPackage:
         target_dir = tempfile.mkdtemp(prefix="package-", dir=self.temp_package_dir)
         with ZipFile(package.path) as zip_file:
-            zip_file.extractall(target_dir)
+            # Only the dist directory is used, so the package sources next to it don't need to be extracted.
+            zip_file.extractall(target_dir, [name for name in zip_file.namelist() if name.startswith(f"{DIST_DIR}/")])
 
         return TestDirPackage(Path(target_dir) / DIST_DIR)
 
@@ -118,19 +122,27 @@ PACKAGE_2 = TestZipPackage(package_dir / "package_2.qpy")
 
 
 @pytest.fixture
-def qpy_server(tmp_path_factory: pytest.TempPathFactory) -> QPyServer:
-    return QPyServer(
+def qpy_server(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Iterator[QPyServer]:
+    """Creates a server using the [ThreadWorker][], unless another worker type is given by indirect parametrization."""
+    if sys.version_info < (3, 12):
+        # The server's startup hooks may replace the global child watcher, which we restore afterwards.
+        previous_child_watcher = asyncio.get_child_watcher()
+
+    yield QPyServer(
         Settings(
             config_files=(),
             general=GeneralSettings(),
             webservice=WebserviceSettings(listen_address="127.0.0.1", listen_port=0),
-            worker=WorkerSettings(type=ThreadWorker),
+            worker=WorkerSettings(type=getattr(request, "param", ThreadWorker)),
             cache_package=PackageCacheSettings(directory=tmp_path_factory.mktemp("qpy_package_cache")),
             cache_repo_index=RepoIndexCacheSettings(directory=tmp_path_factory.mktemp("qpy_repo_index_cache")),
             collector=CollectorSettings(),
         )
     )
 
+    if sys.version_info < (3, 12):
+        asyncio.set_child_watcher(previous_child_watcher)
+
 
 @pytest.fixture
 async def client(qpy_server: QPyServer, aiohttp_client: AiohttpClient) -> TestClient:
@@ -51,6 +51,20 @@ _URL = f"packages/{_PACKAGE_HASH}/options"
 _QUESTION_STATE = (test_data_path / "question_state" / "question_state.json").read_text()
 _REQUEST_MAIN = json.dumps({"context": 1})
 
+_FACTORY_MODEL_PAIRS = (
+    (StaticTextElementFactory, StaticTextElement),
+    (TextInputElementFactory, TextInputElement),
+    (CheckboxElementFactory, CheckboxElement),
+    (CheckboxGroupElementFactory, CheckboxGroupElement),
+    (OptionFactory, Option),
+    (RadioGroupElementFactory, RadioGroupElement),
+    (SelectElementFactory, SelectElement),
+    (HiddenElementFactory, HiddenElement),
+    (GroupElementFactory, GroupElement),
+    (FormSectionFactory, FormSection),
+    (OptionsFormDefinitionFactory, OptionsFormDefinition),
+)
+
 
 async def test_should_validate_main_body_when_question_state_is_not_given(client: TestClient) -> None:
     with patch.object(PackageCollection, "get"):
@@ -96,46 +110,14 @@ async def test_data_gets_cached(client: TestClient) -> None:
     assert res_data == reference
 
 
-@pytest.mark.parametrize(
-    ("factory", "model"),
-    [
-        (StaticTextElementFactory, StaticTextElement),
-        (TextInputElementFactory, TextInputElement),
-        (CheckboxElementFactory, CheckboxElement),
-        (CheckboxGroupElementFactory, CheckboxGroupElement),
-        (OptionFactory, Option),
-        (RadioGroupElementFactory, RadioGroupElement),
-        (SelectElementFactory, SelectElement),
-        (HiddenElementFactory, HiddenElement),
-        (GroupElementFactory, GroupElement),
-        (FormSectionFactory, FormSection),
-        (OptionsFormDefinitionFactory, OptionsFormDefinition),
-    ],
-)
-def test_factory_builds_valid_model(factory: ModelFactory, model: type[BaseModel]) -> None:
+@pytest.mark.parametrize(("factory", "model"), _FACTORY_MODEL_PAIRS)
+def test_factory_builds_valid_model_which_ignores_additional_properties(
+    factory: ModelFactory, model: type[BaseModel]
+) -> None:
     fake_model = factory.build()
     assert isinstance(fake_model, model)
 
-
-@pytest.mark.parametrize(
-    ("factory", "model"),
-    [
-        (StaticTextElementFactory, StaticTextElement),
-        (TextInputElementFactory, TextInputElement),
-        (CheckboxElementFactory, CheckboxElement),
-        (CheckboxGroupElementFactory, CheckboxGroupElement),
-        (OptionFactory, Option),
-        (RadioGroupElementFactory, RadioGroupElement),
-        (SelectElementFactory, SelectElement),
-        (HiddenElementFactory, HiddenElement),
-        (GroupElementFactory, GroupElement),
-        (FormSectionFactory, FormSection),
-        (OptionsFormDefinitionFactory, OptionsFormDefinition),
-    ],
-)
-def test_ignore_additional_properties(factory: ModelFactory, model: type[BaseModel]) -> None:
-    data = factory.build().model_dump()
-    created_model = model(**data, additional_property="test")
+    created_model = model(**fake_model.model_dump(), additional_property="test")
     assert not hasattr(created_model, "additional_property")
 
 
@@ -2,14 +2,15 @@
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
-from asyncio import get_running_loop, wait_for
+from asyncio import get_running_loop
+from asyncio import timeout as asyncio_timeout
 from collections.abc import Callable
 from os import getpid, kill
 from pathlib import Path
 from shutil import copy
 from signal import SIGUSR1
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from _pytest.tmpdir import TempPathFactory
@@ -23,7 +24,7 @@ from tests.conftest import PACKAGE, PACKAGE_2, get_file_hash
 
 
 def create_local_collector(tmp_path_factory: TempPathFactory) -> tuple[LocalCollector, Path]:
-    """Create a local collector and return it and the directory it is using.
+    """Create a local collector with a mocked indexer and return it and the directory it is using.
 
     Args:
         tmp_path_factory (TempPathFactory): Factory for temporary directories.
@@ -32,8 +33,7 @@ def create_local_collector(tmp_path_factory: TempPathFactory) -> tuple[LocalColl
         Local collector and directory.
     """
     path = tmp_path_factory.mktemp("qpy")
-    indexer = Indexer(WorkerPool(1, 200 * MiB))
-    return LocalCollector(path, indexer), path
+    return LocalCollector(path, Mock(spec=Indexer)), path
 
 
 class WaitForAsyncFunctionCall:
@@ -63,7 +63,8 @@ class WaitForAsyncFunctionCall:
             timeout (float): Maximum time to wait (in seconds).
         """
         try:
-            await wait_for(self.fut, timeout)
+            async with asyncio_timeout(timeout):
+                await self.fut
         except TimeoutError:
             pytest.fail(f"Function {self.func} has not been called within {timeout} seconds.", False)
 
@@ -88,8 +89,7 @@ async def test_ignore_files_with_wrong_extension(tmp_path_factory: TempPathFacto
     ignore_file = directory / "wrong.extension"
     ignore_file.touch()
 
-    indexer = Indexer(WorkerPool(1, 200 * MiB))
-    local_collector = LocalCollector(directory, indexer)
+    local_collector = LocalCollector(directory, Mock(spec=Indexer))
 
     async with local_collector:
         assert len(local_collector.map.paths) == 0
@@ -114,7 +114,7 @@ async def test_package_exists_before_init(tmp_path_factory: TempPathFactory) ->
         # Package should exist.
         actual_package_path = await local_collector.get_path(package)
         assert actual_package_path.is_file()
-        assert str(actual_package_path) == package_path
+        assert actual_package_path.samefile(package_path)
         assert get_file_hash(actual_package_path) == package.hash
 
 
@@ -146,8 +146,8 @@ async def test_package_gets_modified(tmp_path_factory: TempPathFactory) -> None:
             patch.object(local_collector.indexer, "register_package") as mock_register,
             patch.object(local_collector.indexer, "unregister_package") as mock_unregister,
         ):
-            # Modify the package.
-            package_path.write_bytes(PACKAGE_2.path.read_bytes())
+            # Modify the package in place.
+            copy(PACKAGE_2.path, package_path)
             await local_collector.update()
 
             # Old package got unregistered and the new one registered in the indexer and local collector.
@@ -156,7 +156,7 @@ async def test_package_gets_modified(tmp_path_factory: TempPathFactory) -> None:
 
             with pytest.raises(FileNotFoundError):
                 await local_collector.get_path(package_1)
-            assert Path(package_path) == await local_collector.get_path(package_2)
+            assert package_path == await local_collector.get_path(package_2)
 
 
 async def test_package_gets_deleted(tmp_path_factory: TempPathFactory) -> None:
@@ -233,7 +233,7 @@ async def test_package_gets_moved_from_package_to_non_package(tmp_path_factory:
     async with local_collector:
         with patch.object(local_collector.indexer, "unregister_package") as mock_unregister:
             # Rename the package.
-            Path(src_path).rename(dest_path)
+            src_path.rename(dest_path)
             await local_collector.update()
 
             # Package got unregistered in the indexer and local collector.
@@ -253,8 +253,7 @@ async def test_package_gets_moved_to_different_folder(tmp_path_factory: TempPath
         # Use new_directory as the directory to be watched and directory to be the new directory of the package.
         directory, new_directory = new_directory, directory
 
-    indexer = Indexer(WorkerPool(1, 200 * MiB))
-    local_collector = LocalCollector(directory, indexer)
+    local_collector = LocalCollector(directory, Mock(spec=Indexer))
 
     # Create a package in the directory.
     src_path = Path(copy(PACKAGE.path, directory))
@@ -5,7 +5,6 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from _pytest.tmpdir import TempPathFactory
 from semver import VersionInfo
 
 from questionpy_server.cache import FileLimitLRU
@@ -89,8 +88,8 @@ def test_get_packages() -> None:
         get_package_versions_infos.assert_called_once()
 
 
-async def test_notify_indexer_on_cache_deletion(tmp_path_factory: TempPathFactory) -> None:
-    cache = FileLimitLRU(tmp_path_factory.mktemp("qpy"), 100)
+async def test_notify_indexer_on_cache_deletion() -> None:
+    cache = Mock(spec=FileLimitLRU)
     PackageCollection(None, {}, Mock(), cache, Mock())
 
     # The callback should unregister the package from the indexer.
@@ -2,8 +2,9 @@
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
-from asyncio import sleep
+from asyncio import Event, wait_for
 from datetime import timedelta
+from typing import Any
 from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
@@ -12,21 +13,30 @@ from questionpy_server.collector.repo_collector import RepoCollector
 from questionpy_server.repository.helper import DownloadError
 from tests.test_data.factories import RepoMetaFactory
 
+_OLD_META = RepoMetaFactory.build(timestamp=1)
+_NEW_META = RepoMetaFactory.build(timestamp=2)
+
 
 async def test_update_gets_called_periodically_after_start() -> None:
-    collector = RepoCollector("", timedelta(seconds=0.1), AsyncMock(), AsyncMock(), AsyncMock())
-    with patch.object(collector, "update") as update:
+    collector = RepoCollector("", timedelta(seconds=0.01), AsyncMock(), AsyncMock(), AsyncMock())
+    called_three_times = Event()
+
+    def count_update(**_: Any) -> None:
+        if update.call_count == 3:  # 1 on startup + 2 periodic updates
+            called_three_times.set()
+
+    with patch.object(collector, "update", side_effect=count_update) as update:
         async with collector:
-            await sleep(0.25)
-            assert update.call_count == 3  # 1 on startup + 2 during the test
+            await wait_for(called_three_times.wait(), 1)
 
 
 async def test_update_downloads_packages_only_on_newer_package_index() -> None:
     collector = RepoCollector("", Mock(), AsyncMock(), AsyncMock(), AsyncMock())
     with patch.object(collector, "_repository") as repository:
-        # Initial update.
         repository.get_packages = AsyncMock(return_value={})
-        repository.get_meta = AsyncMock(return_value=RepoMetaFactory.build(timestamp=1))
+        repository.get_meta = AsyncMock(side_effect=[_OLD_META, _OLD_META, _NEW_META])
+
+        # Initial update.
         await collector.update()
         assert repository.get_packages.call_count == 1
 
@@ -35,7 +45,6 @@ async def test_update_downloads_packages_only_on_newer_package_index() -> None:
         assert repository.get_packages.call_count == 1
 
         # Package index got updated.
-        repository.get_meta = AsyncMock(return_value=RepoMetaFactory.build(timestamp=2))
         await collector.update()
         assert repository.get_packages.call_count == 2
 
@@ -64,16 +73,15 @@ async def test_package_index_gets_updated(first_update: list[str], second_update
     second_packages = {package_hash: Mock() for package_hash in second_update}
 
     with patch.object(collector, "_repository") as repository:
+        repository.get_packages = AsyncMock(side_effect=[first_packages, second_packages])
+        repository.get_meta = AsyncMock(side_effect=[_OLD_META, _NEW_META])
+
         # Initial update.
-        repository.get_packages = AsyncMock(return_value=first_packages)
-        repository.get_meta = AsyncMock(return_value=RepoMetaFactory.build(timestamp=1))
         await collector.update()
         calls = [call(package_hash, package.manifest, collector) for package_hash, package in first_packages.items()]
         indexer.register_package.assert_has_calls(calls, any_order=True)
 
         # Update repository.
-        repository.get_packages = AsyncMock(return_value=second_packages)
-        repository.get_meta = AsyncMock(return_value=RepoMetaFactory.build(timestamp=2))
         await collector.update()
 
         # Removed packages should be unregistered.
@@ -103,7 +111,7 @@ async def test_get_path_raises_file_not_found_error_on_download_error() -> None:
     with patch.object(collector, "_repository") as repository:
         # Initial update.
         repository.get_packages = AsyncMock(return_value={package.hash: package})
-        repository.get_meta = AsyncMock(return_value=RepoMetaFactory.build(timestamp=1))
+        repository.get_meta = AsyncMock(return_value=_OLD_META)
         await collector.update()
 
         # Get path.
@@ -121,7 +129,7 @@ async def test_get_path_caches_package() -> None:
     with patch.object(collector, "_repository") as repository:
         # Initial update.
         repository.get_packages = AsyncMock(return_value={package.hash: package})
-        repository.get_meta = AsyncMock(return_value=RepoMetaFactory.build(timestamp=1))
+        repository.get_meta = AsyncMock(return_value=_OLD_META)
         await collector.update()
 
         # Get path.
@@ -0,0 +1,30 @@
+#  This file is part of the QuestionPy Server. (https://questionpy.org)
+#  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+
+import asyncio
+import os
+import sys
+
+import pytest
+from aiohttp.pytest_plugin import AiohttpClient
+
+from questionpy_server.web.app import QPyServer
+from questionpy_server.worker.impl.subprocess import SubprocessWorker
+from tests.conftest import PACKAGE
+
+
+@pytest.mark.parametrize("qpy_server", [SubprocessWorker], indirect=True)
+async def test_should_start_subprocess_worker_after_startup(
+    qpy_server: QPyServer, aiohttp_client: AiohttpClient
+) -> None:
+    # Creating the client runs the app's startup hooks on the already running loop, just like web.run_app does.
+    await aiohttp_client(qpy_server.web_app)
+
+    if sys.version_info < (3, 12) and hasattr(os, "pidfd_open"):
+        assert isinstance(asyncio.get_child_watcher(), asyncio.PidfdChildWatcher)
+
+    async with qpy_server.worker_pool.get_worker(PACKAGE, 1, 1) as worker:
+        manifest = await worker.get_manifest()
+
+    assert manifest == PACKAGE.manifest
@@ -1,7 +1,11 @@
 #  This file is part of the QuestionPy Server. (https://questionpy.org)
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import logging
+import os
 import resource
+import sys
+from asyncio import StreamReader
 from collections.abc import Iterator
 from contextlib import contextmanager
 from time import process_time, sleep, time
@@ -14,11 +18,12 @@ from questionpy_common.constants import MiB
 from questionpy_server import WorkerPool
 from questionpy_server.worker.exception import (
     WorkerCPUTimeLimitExceededError,
+    WorkerNotRunningError,
     WorkerRealTimeLimitExceededError,
     WorkerStartError,
 )
 from questionpy_server.worker.impl._base import BaseWorker, LimitTimeUsageMixin
-from questionpy_server.worker.impl.subprocess import SubprocessWorker
+from questionpy_server.worker.impl.subprocess import SubprocessWorker, _StderrBuffer
 from questionpy_server.worker.runtime.manager import WorkerManager
 from tests.conftest import PACKAGE
 from tests.questionpy_server.worker.impl.conftest import patch_worker_pool
@@ -40,6 +45,34 @@ async def test_should_apply_limits(pool: WorkerPool) -> None:
     assert soft == hard == 200 * MiB
 
 
+async def test_should_get_resource_usage(pool: WorkerPool) -> None:
+    async with pool.get_worker(PACKAGE, 1, 1) as worker:
+        assert isinstance(worker, SubprocessWorker)
+        assert worker._proc
+        usage = await worker.get_resource_usage()
+
+        assert usage.memory == psutil.Process(worker._proc.pid).memory_info().rss
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="statm is only read on Linux")
+async def test_should_raise_worker_not_running_error_when_reading_rss_of_reaped_worker(pool: WorkerPool) -> None:
+    async with pool.get_worker(PACKAGE, 1, 1) as worker:
+        assert isinstance(worker, SubprocessWorker)
+        assert worker._statm_fd is not None
+        statm_fd = os.dup(worker._statm_fd)
+
+    try:
+        # The worker got stopped and reaped when leaving the context. Reading its statm now fails with ESRCH.
+        assert worker._proc
+        assert worker._proc.returncode is not None
+        worker._statm_fd = statm_fd
+        with pytest.raises(WorkerNotRunningError):
+            worker._get_rss()
+    finally:
+        worker._statm_fd = None
+        os.close(statm_fd)
+
+
 @contextmanager
 def _make_get_manifest_busy_wait() -> Iterator[None]:
     def busy_wait(self: WorkerManager) -> None:
@@ -86,3 +119,43 @@ async def test_should_raise_real_timout_error(pool: WorkerPool) -> None:
                 await worker.get_manifest()
         assert isinstance(exc_info.value.__cause__, WorkerRealTimeLimitExceededError)
         assert 0.6 < (time() - start_time) < 2.0
+
+
+@pytest.mark.parametrize("debug", [True, False])
+async def test_should_only_capture_stderr_when_debug_logging_is_enabled(
+    pool: WorkerPool, caplog: pytest.LogCaptureFixture, *, debug: bool
+) -> None:
+    caplog.set_level(logging.DEBUG if debug else logging.INFO, "questionpy_server.worker.impl.subprocess")
+
+    async with pool.get_worker(PACKAGE, 1, 1) as worker:
+        assert isinstance(worker, SubprocessWorker)
+        assert worker._proc
+        assert (worker._proc.stderr is not None) is debug
+        assert (worker._stderr_buffer is not None) is debug
+
+
+async def test_stderr_buffer_should_log_indented_lines(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG, "questionpy_server.worker.impl.subprocess")
+    stream = StreamReader()
+    stream.feed_data(b"first line\nsecond line")
+    stream.feed_eof()
+
+    stderr_buffer = _StderrBuffer(stream)
+    await stderr_buffer.read_stderr()
+    stderr_buffer.flush()
+    stderr_buffer.flush()
+
+    assert caplog.messages == ["Worker wrote following data to stdout/stderr.\n\tfirst line\n\tsecond line"]
+
+
+async def test_stderr_buffer_should_skip_data_when_debug_logging_is_disabled(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, "questionpy_server.worker.impl.subprocess")
+    stream = StreamReader()
+    stream.feed_data(b"some output")
+    stream.feed_eof()
+
+    stderr_buffer = _StderrBuffer(stream)
+    await stderr_buffer.read_stderr()
+
+    assert not stderr_buffer._buffer
+    assert stderr_buffer._skipped_bytes == len(b"some output")
@@ -2,6 +2,7 @@
 #  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
+import asyncio
 import resource
 from unittest.mock import patch
 
@@ -9,7 +10,7 @@ import pytest
 
 from questionpy_common.constants import MiB
 from questionpy_server import WorkerPool
-from questionpy_server.worker.impl.thread import ThreadWorker
+from questionpy_server.worker.impl.thread import ThreadWorker, _InProcessConnection
 from tests.conftest import PACKAGE
 
 
@@ -24,3 +25,15 @@ async def test_should_ignore_limits(pool: WorkerPool) -> None:
             pass
 
         mock.assert_not_called()
+
+
+async def test_should_close_both_sides_of_in_process_connection() -> None:
+    connection = _InProcessConnection()
+    connection.close()
+
+    with pytest.raises(StopAsyncIteration):
+        async with asyncio.timeout(1):
+            await anext(connection.server)
+
+    with pytest.raises(BrokenPipeError):
+        connection.worker.receive_message()
@@ -0,0 +1,26 @@
+#  This file is part of the QuestionPy Server. (https://questionpy.org)
+#  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+
+import os
+import sys
+
+import pytest
+
+from questionpy_server.worker.runtime.subprocess_main import STDERR_PIPE_SIZE, _enlarge_stderr_pipe
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="pipe sizes can only be changed on Linux")
+def test_should_enlarge_stderr_pipe(monkeypatch: pytest.MonkeyPatch) -> None:
+    from fcntl import F_GETPIPE_SZ, fcntl  # noqa: PLC0415
+
+    read_fd, write_fd = os.pipe()
+    try:
+        with os.fdopen(write_fd, "w", closefd=False) as stderr, monkeypatch.context() as patch:
+            patch.setattr(sys, "stderr", stderr)
+            _enlarge_stderr_pipe()
+
+        assert fcntl(write_fd, F_GETPIPE_SZ) >= STDERR_PIPE_SIZE
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
@@ -0,0 +1,162 @@
+#  This file is part of the QuestionPy Server. (https://questionpy.org)
+#  The QuestionPy Server is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+
+import asyncio
+import os
+from io import BufferedReader, FileIO
+from pathlib import Path
+
+import pytest
+
+from questionpy_common.api.attempt import (
+    AttemptModel,
+    AttemptScoredModel,
+    AttemptStartedModel,
+    AttemptUi,
+    ScoringCode,
+)
+from questionpy_common.api.question import QuestionModel, ScoringMethod
+from questionpy_common.constants import MiB
+from questionpy_common.elements import OptionsFormDefinition, TextInputElement
+from questionpy_common.environment import RequestUser, WorkerResourceLimits
+from questionpy_common.manifest import Manifest
+from questionpy_server.worker.connection import ServerToWorkerConnection
+from questionpy_server.worker.runtime.connection import WorkerToServerConnection
+from questionpy_server.worker.runtime.messages import (
+    CreateQuestionFromOptions,
+    Exit,
+    GetOptionsForm,
+    GetQPyPackageManifest,
+    InitWorker,
+    LoadQPyPackage,
+    MessageIds,
+    MessageToServer,
+    MessageToWorker,
+    ScoreAttempt,
+    StartAttempt,
+    ViewAttempt,
+    WorkerError,
+)
+from questionpy_server.worker.runtime.package_location import ZipPackageLocation
+
+_user = RequestUser(["de", "en"])
+_ui = AttemptUi(formulation="<div>Formulation</div>")
+
+MESSAGES_TO_WORKER: list[MessageToWorker] = [
+    InitWorker(
+        limits=WorkerResourceLimits(max_memory=200 * MiB, max_cpu_time_seconds_per_call=10), worker_type="thread"
+    ),
+    Exit(),
+    LoadQPyPackage(location=ZipPackageLocation(Path("/tmp/package.qpy")), main=True),
+    GetQPyPackageManifest(path="/tmp/package.qpy"),
+    GetOptionsForm(request_user=_user, question_state=None),
+    CreateQuestionFromOptions(request_user=_user, question_state="{}", form_data={"input": "välue", "n": [1, 2.5]}),
+    StartAttempt(request_user=_user, question_state="{}", variant=1),
+    ViewAttempt(request_user=_user, question_state="{}", attempt_state="{}", scoring_state=None, response=None),
+    ScoreAttempt(request_user=_user, question_state="{}", attempt_state="{}", scoring_state="{}", response={"a": 1}),
+]
+
+MESSAGES_TO_SERVER: list[MessageToServer] = [
+    InitWorker.Response(),
+    LoadQPyPackage.Response(),
+    GetQPyPackageManifest.Response(
+        manifest=Manifest(short_name="package", namespace="local", version="0.1.0", api_version="0.1", author="Author")
+    ),
+    GetOptionsForm.Response(
+        definition=OptionsFormDefinition(general=[TextInputElement(name="input", label="Input")]),
+        form_data={"input": "value"},
+    ),
+    CreateQuestionFromOptions.Response(
+        question_state="{}",
+        question_model=QuestionModel(lang="de", scoring_method=ScoringMethod.AUTOMATICALLY_SCORABLE),
+    ),
+    StartAttempt.Response(attempt_started_model=AttemptStartedModel(lang="de", variant=1, ui=_ui, attempt_state="{}")),
+    ViewAttempt.Response(attempt_model=AttemptModel(lang="de", variant=1, ui=_ui)),
+    ScoreAttempt.Response(
+        attempt_scored_model=AttemptScoredModel(
+            lang="de",
+            variant=1,
+            ui=_ui,
+            scoring_code=ScoringCode.AUTOMATICALLY_SCORED,
+            score=0.5,
+            score_final=0.5,
+        )
+    ),
+    WorkerError(
+        expected_response_id=MessageIds.RETURN_VIEW_ATTEMPT, type=WorkerError.ErrorType.UNKNOWN, message="error"
+    ),
+]
+
+
+def test_all_message_types_are_covered() -> None:
+    assert {type(message) for message in MESSAGES_TO_WORKER} == set(MessageToWorker.types.values())
+    assert {type(message) for message in MESSAGES_TO_SERVER} == set(MessageToServer.types.values())
+
+
+async def _connect_read_pipe(read_fd: int) -> tuple[asyncio.StreamReader, asyncio.ReadTransport]:
+    stream_in = asyncio.StreamReader()
+    transport, _ = await asyncio.get_running_loop().connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(stream_in), FileIO(read_fd, "rb")
+    )
+    return stream_in, transport
+
+
+@pytest.mark.parametrize("message", MESSAGES_TO_WORKER, ids=lambda message: type(message).__name__)
+async def test_should_send_message_from_server_to_worker(message: MessageToWorker) -> None:
+    read_fd, write_fd = os.pipe()
+    with (
+        BufferedReader(FileIO(read_fd, "rb")) as stream_in,
+        FileIO(write_fd, "wb") as stream_out,
+        FileIO(os.devnull, "wb") as devnull,
+    ):
+        server = ServerToWorkerConnection(asyncio.StreamReader(), stream_out)
+        worker = WorkerToServerConnection(stream_in, devnull)
+
+        server.send_message(message)
+        received = await asyncio.to_thread(worker.receive_message)
+
+    assert type(received) is type(message)
+    assert received == message
+
+
+@pytest.mark.parametrize("message", MESSAGES_TO_SERVER, ids=lambda message: type(message).__qualname__)
+async def test_should_send_message_from_worker_to_server(message: MessageToServer) -> None:
+    read_fd, write_fd = os.pipe()
+    stream_in, transport = await _connect_read_pipe(read_fd)
+    try:
+        with FileIO(write_fd, "wb") as stream_out, BufferedReader(FileIO(os.devnull, "rb")) as devnull:
+            worker = WorkerToServerConnection(devnull, stream_out)
+            server = ServerToWorkerConnection(stream_in, stream_out)
+
+            worker.send_message(message)
+            received = await server.receive_message()
+    finally:
+        transport.close()
+
+    assert type(received) is type(message)
+    assert received == message
+
+
+async def test_should_stop_iterating_when_worker_closes_pipe() -> None:
+    read_fd, write_fd = os.pipe()
+    stream_in, transport = await _connect_read_pipe(read_fd)
+    try:
+        with FileIO(os.devnull, "wb") as devnull:
+            server = ServerToWorkerConnection(stream_in, devnull)
+            os.close(write_fd)
+
+            with pytest.raises(StopAsyncIteration):
+                await anext(server)
+    finally:
+        transport.close()
+
+
+def test_should_raise_broken_pipe_error_when_server_closes_pipe() -> None:
+    read_fd, write_fd = os.pipe()
+    with BufferedReader(FileIO(read_fd, "rb")) as stream_in, FileIO(os.devnull, "wb") as devnull:
+        worker = WorkerToServerConnection(stream_in, devnull)
+        os.close(write_fd)
+
+        with pytest.raises(BrokenPipeError):
+            worker.receive_message()